@@ -169,8 +169,9 @@ function scan_wdb(item_id)
 	while processed <= 100 and item_id <= MAX_ITEM_ID do
 		local itemstring = 'item:' .. item_id
 		local name, _, quality, level, class, subclass, max_stack, slot, texture = GetItemInfo(itemstring)
-		if name and not aux.account_data.item_ids[strlower(name)] then
-            aux.account_data.item_ids[strlower(name)] = item_id
+		local key = name and strlower(name)
+		if key and not aux.account_data.item_ids[key] then
+            aux.account_data.item_ids[key] = item_id
 			aux.account_data.items[item_id] = persistence.write(items_schema, T.temp-T.map(
 				'name', name,
 				'quality', quality,
@@ -183,7 +184,7 @@ function scan_wdb(item_id)
 			))
 			local tooltip = tooltip('link', itemstring)
 			if auctionable(tooltip, quality) then
-				tinsert(aux.account_data.auctionable_items, strlower(name))
+				tinsert(aux.account_data.auctionable_items, key)
 			end
 			processed = processed + 1
 		end
@@ -124,8 +124,9 @@ function M.value(item_key)
 		item_record = read_record(item_key)
 		if getn(item_record.data_points) > 0 then
 			local total_weight, weighted_values = 0, T.temp-T.acquire()
+			local latest_time = item_record.data_points[1].time
 			for _, data_point in item_record.data_points do
-				local weight = .99 ^ aux.round((item_record.data_points[1].time - data_point.time) / (60 * 60 * 24))
+				local weight = .99 ^ aux.round((latest_time - data_point.time) / (60 * 60 * 24))
 				total_weight = total_weight + weight
 				tinsert(weighted_values, T.map('value', data_point.value, 'weight', weight))
 			end
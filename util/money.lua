@@ -21,41 +21,43 @@ function M.from_gsc(gold, silver, copper)
 	return gold * COPPER_PER_GOLD + silver * COPPER_PER_SILVER + copper
 end
 
-function M.to_string2(money, exact, color)
-	color = color or FONT_COLOR_CODE_CLOSE
-
+do
 	local TEXT_NONE = '0'
 
 	local GOLD = 'ffd100'
 	local SILVER = 'e6e6e6'
 	local COPPER = 'c8602c'
 	local START = '|cff%s%d' .. FONT_COLOR_CODE_CLOSE
-	local PART = color .. '.|cff%s%02d' .. FONT_COLOR_CODE_CLOSE
+	local PART = '.|cff%s%02d' .. FONT_COLOR_CODE_CLOSE
 	local NONE = '|cffa0a0a0' .. TEXT_NONE .. FONT_COLOR_CODE_CLOSE
 
-	if not exact and money >= COPPER_PER_GOLD then
-		money = aux.round(money / COPPER_PER_SILVER) * COPPER_PER_SILVER
-	end
-	local g, s, c = to_gsc(money)
+	function M.to_string2(money, exact, color)
+		local part = (color or FONT_COLOR_CODE_CLOSE) .. PART
 
-	local str = ''
+		if not exact and money >= COPPER_PER_GOLD then
+			money = aux.round(money / COPPER_PER_SILVER) * COPPER_PER_SILVER
+		end
+		local g, s, c = to_gsc(money)
 
-	local fmt = START
-	if g > 0 then
-		str = str .. format(fmt, GOLD, g)
-		fmt = PART
-	end
-	if s > 0 or c > 0 then
-		str = str .. format(fmt, SILVER, s)
-		fmt = PART
-	end
-	if c > 0 then
-		str = str .. format(fmt, COPPER, c)
-	end
-	if str == '' then
-		str = NONE
+		local str = ''
+
+		local fmt = START
+		if g > 0 then
+			str = str .. format(fmt, GOLD, g)
+			fmt = part
+		end
+		if s > 0 or c > 0 then
+			str = str .. format(fmt, SILVER, s)
+			fmt = part
+		end
+		if c > 0 then
+			str = str .. format(fmt, COPPER, c)
+		end
+		if str == '' then
+			str = NONE
+		end
+		return str
 	end
-	return str
 end
 
 function M.to_string(money, pad, trim, color, no_color)